@@ -1,11 +1,13 @@
 """The script that is run to do any management tasks like creating the app or the service"""
 import os
-import shutil
-from typing import List
+from functools import lru_cache
+from typing import Iterator, Optional, Sequence
 
 import click
 
 STUBS_FOLDER_PATH = os.path.join(os.path.dirname(__file__), "stubs")
+_COPY_CHUNK_SIZE = 1024 * 1024
+_MAX_SERIAL_COPIES = 8
 
 
 @click.group()
@@ -43,21 +45,95 @@ def _copy_stub_file(dst: str, file_name: str):
     """Copies a stub file from the stubs folder to the destination folder"""
     stub_file = os.path.join(STUBS_FOLDER_PATH, file_name)
     new_file_path = os.path.join(dst, file_name)
-    shutil.copyfile(stub_file, new_file_path)
+    _fast_copyfile(stub_file, new_file_path)
+
+
+def _fast_copyfile(src: str, dst: str, mode: Optional[int] = None):
+    """
+    Copies the file at src to dst, doing the copy in the kernel via os.copy_file_range
+    where the platform supports it, and falling back to shutil.copyfile elsewhere
+
+    When mode is given (e.g. from a cached DirEntry.stat()), it is applied to dst
+    via os.fchmod so that no extra stat of src is needed to preserve permissions
+
+    The copy is staged in a temporary file beside dst and moved into place with
+    os.replace so a half-written file is never visible at the destination path
+    """
+    tmp_dst = f"{dst}.{os.getpid()}.tmp"
+
+    if not hasattr(os, "copy_file_range"):
+        _shutil_copyfile(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(tmp_dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            while os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE) > 0:
+                pass
+            if mode is not None:
+                os.fchmod(dst_fd, mode)
+        finally:
+            os.close(dst_fd)
+        os.replace(tmp_dst, dst)
+    except OSError:
+        _shutil_copyfile(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+    finally:
+        os.close(src_fd)
+
+
+def _shutil_copyfile(src: str, dst: str):
+    """Fallback copy via shutil, imported lazily to keep it off the CLI start-up path"""
+    import shutil
+
+    shutil.copyfile(src, dst)
 
 
 def _copy_stub_service_to_folder(dst: str):
     """Copies the stub service to the folder path (dst) provided"""
+    _copy_files_to_folder(_get_stub_service_files(), dst=dst)
+
+
+@lru_cache(maxsize=None)
+def _get_stub_service_files() -> Sequence[os.DirEntry]:
+    """
+    Returns the files of the stub service, scanning the stubs folder only once
+    however many services are created in a single invocation
+    """
     stub_service_folder_path = os.path.join(STUBS_FOLDER_PATH, "service")
-    stub_service_files = _get_files_in_folder(parent_dir=stub_service_folder_path)
-    for file in stub_service_files:
-        new_file_path = os.path.join(dst, file.name)
-        shutil.copyfile(file.path, new_file_path)
+    return tuple(_get_files_in_folder(parent_dir=stub_service_folder_path))
+
+
+def _copy_files_to_folder(files: Sequence[os.DirEntry], dst: str):
+    """
+    Copies the given files to the folder path (dst) provided in one batch,
+    spreading the copies over a thread pool when there are enough files for the
+    parallelism to pay off
+    """
+    if os.name == "nt" or len(files) > _MAX_SERIAL_COPIES:
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(32, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda file: _copy_file_entry(file, dst=dst), files))
+        return
+
+    for file in files:
+        _copy_file_entry(file, dst=dst)
+
+
+def _copy_file_entry(file: os.DirEntry, dst: str):
+    """Copies a single DirEntry into the folder path (dst) provided"""
+    stat = file.stat(follow_symlinks=False)
+    _fast_copyfile(file.path, os.path.join(dst, file.name), mode=stat.st_mode)
 
 
-def _get_files_in_folder(parent_dir: str) -> List[os.DirEntry]:
-    """Returns all the files in a given parent folder"""
-    return [file for file in os.scandir(parent_dir) if file.is_file(follow_symlinks=False)]  # noqa
+def _get_files_in_folder(parent_dir: str) -> Iterator[os.DirEntry]:
+    """Yields all the files in a given parent folder in a single scandir pass"""
+    with os.scandir(parent_dir) as entries:
+        yield from (file for file in entries if file.is_file(follow_symlinks=False))  # noqa
 
 
 if __name__ == '__main__':
@@ -13,13 +13,13 @@ from .crud import (
 )
 
 __all__ = [
-    Action,
-    CreateOneAction,
-    CreateManyAction,
-    ReadOneAction,
-    ReadManyAction,
-    UpdateOneAction,
-    UpdateManyAction,
-    DeleteOneAction,
-    DeleteManyAction,
+    "Action",
+    "CreateOneAction",
+    "CreateManyAction",
+    "ReadOneAction",
+    "ReadManyAction",
+    "UpdateOneAction",
+    "UpdateManyAction",
+    "DeleteOneAction",
+    "DeleteManyAction",
 ]
@@ -7,6 +7,7 @@ class Action:
     Base class for all Action classes that do the business logic of the app;
     often connecting the routes (the presentation) to the persistence layer (the repositories)
     """
+    __slots__ = ()
 
     @abstractmethod
     def run(self):
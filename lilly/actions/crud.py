@@ -10,6 +10,7 @@ from ..repositories import Repository
 
 class CreateOneAction(Action):
     """Action to create one item in a repository"""
+    __slots__ = ("_record", "_options")
 
     def __init__(self, record: BaseModel, **kwargs):
         """
@@ -38,6 +39,7 @@ class CreateOneAction(Action):
 
 class CreateManyAction(Action):
     """Action to create many items in the associated repository"""
+    __slots__ = ("_records", "_options")
 
     def __init__(self, records: List[BaseModel], **kwargs):
         """
@@ -66,6 +68,7 @@ class CreateManyAction(Action):
 
 class ReadOneAction(Action):
     """Action to read one from the associated repository"""
+    __slots__ = ("_record_id", "_options")
 
     def __init__(self, record_id: Any, **kwargs):
         """
@@ -94,6 +97,7 @@ class ReadOneAction(Action):
 
 class ReadManyAction(Action):
     """Action to read many from the associated repository"""
+    __slots__ = ("_criterion", "_filters", "_limit", "_skip")
 
     def __init__(self, *criterion, skip: int = 0, limit: Optional[int] = None, **filters):
         """
@@ -136,6 +140,7 @@ class ReadManyAction(Action):
 
 class UpdateOneAction(Action):
     """Action to update one record in the associated repository"""
+    __slots__ = ("_record_id", "_new_record", "_options")
 
     def __init__(self, record_id: Any, new_record: BaseModel, **kwargs):
         """
@@ -166,6 +171,7 @@ class UpdateOneAction(Action):
 
 class UpdateManyAction(Action):
     """Action to update many records in the associated repository"""
+    __slots__ = ("_new_record", "_criterion", "_filters")
 
     def __init__(self, new_record: BaseModel, *criterion, **filters):
         """
@@ -206,6 +212,7 @@ class UpdateManyAction(Action):
 
 class DeleteOneAction(Action):
     """Action to delete one record in the associated repository"""
+    __slots__ = ("_record_id", "_options")
 
     def __init__(self, record_id: Any, **kwargs):
         """
@@ -234,6 +241,7 @@ class DeleteOneAction(Action):
 
 class DeleteManyAction(Action):
     """Action to delete many records in the associated repository"""
+    __slots__ = ("_criterion", "_filters")
 
     def __init__(self, *criterion, **filters):
         """
@@ -3,4 +3,4 @@
 from .base import DataSource
 from .sqlalchemy import SQLAlchemyDataSource
 
-__all__ = [DataSource, SQLAlchemyDataSource]
+__all__ = ["DataSource", "SQLAlchemyDataSource"]
@@ -1,56 +1,222 @@
 """DataSource from SQLAlchemy"""
-from typing import Optional
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set
 
-from sqlalchemy import create_engine
+from sqlalchemy import Table, create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker, DeclarativeMeta
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session, sessionmaker, scoped_session, DeclarativeMeta
 
 from .base import DataSource
 
 
 class SQLAlchemySessionContextManager:
-    """This is a special context manager to ensure the created session is closed when used"""
-
-    def __init__(self, engine: Engine):
-        self.__engine = engine
+    """
+    This is a special context manager to ensure the created session is closed when used
+
+    It is reentrant per thread: when entered while another block on the same datasource
+    is still active in the current thread, it hands out the same thread-local session and
+    leaves closing it to the outermost block, so nested repository calls do not pay for
+    (or prematurely release) extra pool checkouts
+    """
+
+    def __init__(self, session_factory: scoped_session, state: threading.local):
+        self.__session_factory = session_factory
+        self.__state = state
         self.__session: Optional[Session] = None
 
     def __enter__(self) -> Session:
-        self.__session = sessionmaker(bind=self.__engine, autocommit=False, autoflush=False)()
+        self.__state.depth = getattr(self.__state, "depth", 0) + 1
+        self.__session = self.__session_factory()
         return self.__session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.__session.close()
+        self.__state.depth -= 1
+        if self.__state.depth == 0:
+            self.__session.close()
 
 
 class SQLAlchemyDataSource(DataSource):
-    """The data source that connects to relational databases via SQLAlchemy"""
+    """
+    The data source that connects to relational databases via SQLAlchemy
+
+    Any key-word arguments accepted by sqlalchemy.create_engine can be passed as **options
+    e.g. pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping, poolclass.
+    For non-sqlite databases, pool_size and max_overflow default to 10 and 20 respectively
+    so that the connection pool is not the throughput ceiling under concurrent requests
+    """
     _is_initialized: bool = False
+    # engines whose DDL has already been run in this process, shared across instances
+    _initialized_engines: Set[Engine] = set()
+    # guards the one-off DDL so racing threads cannot run create_all twice
+    _initialization_lock = threading.Lock()
 
     def __init__(self, declarative_meta: DeclarativeMeta, db_uri: str, **options):
         self._declarative_meta = declarative_meta
 
-        if db_uri.startswith("sqlite"):
+        # a roomier compiled-statement cache than the default 500 so that busy apps
+        # with many distinct query shapes keep hitting it
+        options.setdefault("query_cache_size", 1200)
+
+        is_sqlite = db_uri.startswith("sqlite")
+        if is_sqlite:
             # remove the same_thread_check done by sqlite
             connect_args = options.get("connect_args", {})
             connect_args.update({"check_same_thread": False})
             options["connect_args"] = connect_args
 
-        self._engine = create_engine(db_uri, **options)
+            if _is_sqlite_in_memory(db_uri):
+                # an in-memory database lives and dies with its connection, so share
+                # one connection instead of pooling connections to separate databases
+                options.setdefault("poolclass", StaticPool)
+        else:
+            options.setdefault("pool_size", 10)
+            options.setdefault("max_overflow", 20)
+            # hand out the most recently returned connection first so idle ones
+            # age out and get closed instead of being kept warm forever
+            options.setdefault("pool_use_lifo", True)
+
+            if _is_behind_pgbouncer(options):
+                # pre-ping's SELECT 1 never commits and thus piles up "idle in transaction"
+                # server connections in PgBouncer's transaction mode; recycle pooled
+                # connections instead, before PgBouncer's server_idle_timeout closes them
+                options.setdefault("pool_pre_ping", False)
+                options.setdefault("pool_recycle", 60)
+            else:
+                # ping connections checked out of the pool so that stale ones
+                # e.g. after a database restart are replaced instead of erroring
+                options.setdefault("pool_pre_ping", True)
+
+        if db_uri.startswith("postgresql"):
+            # let psycopg2 batch executemany INSERTs instead of sending them row by row
+            options.setdefault("executemany_mode", "values_plus_batch")
+            options.setdefault("executemany_values_page_size", 1000)
+            options.setdefault("executemany_batch_page_size", 500)
+
+        self._engine = _get_engine(db_uri, **options)
+        self._session_factory = scoped_session(
+            sessionmaker(bind=self._engine, autocommit=False, autoflush=False, expire_on_commit=False))
+        self._connection_state = threading.local()
+
+        if is_sqlite:
+            _register_sqlite_pragmas(self._engine)
 
     def connect(self) -> SQLAlchemySessionContextManager:
         """Connects to the database and returns a session to use for making queries"""
         if not self._is_initialized:
-            self.initialize_db()
+            with self._initialization_lock:
+                if self._engine in self._initialized_engines:
+                    # another datasource on the same shared engine already ran the DDL
+                    self._is_initialized = True
+                elif not self._is_initialized:
+                    self.initialize_db()
 
-        return SQLAlchemySessionContextManager(self._engine)
+        return SQLAlchemySessionContextManager(self._session_factory, self._connection_state)
 
     def initialize_db(self):
         """Does any tasks to prepare the database for use"""
         self._declarative_meta.metadata.create_all(bind=self._engine)
         self._is_initialized = True
+        self._initialized_engines.add(self._engine)
 
     def clear_db(self):
         """Clears the whole database, removing the associated tables"""
-        self._declarative_meta.metadata.drop_all(bind=self._engine)
+        # when we know our own DDL created the tables, skip the per-table
+        # existence probe each DROP would otherwise issue (a round-trip apiece)
+        self._declarative_meta.metadata.drop_all(bind=self._engine, checkfirst=not self._is_initialized)
         self._is_initialized = False
+        self._initialized_engines.discard(self._engine)
+
+    def bulk_ingest(self, table: Table, rows: List[Dict[str, Any]]):
+        """
+        Inserts many rows into the given table using the fastest path the dialect offers
+        i.e. COPY FROM STDIN on postgresql and a single executemany INSERT elsewhere
+
+        Arguments:
+            table (Table): the table to insert the rows into
+            rows (list[dict[str, Any]]): the rows to insert, as mappings of column name to value
+        """
+        if not rows:
+            return
+
+        if not self._is_initialized:
+            self.initialize_db()
+
+        if self._engine.dialect.name == "postgresql":
+            self._bulk_ingest_via_copy(table, rows)
+            return
+
+        with self._engine.begin() as connection:
+            connection.execute(table.insert(), rows)
+
+    def _bulk_ingest_via_copy(self, table: Table, rows: List[Dict[str, Any]]):
+        """Inserts many rows into the given table via postgresql's COPY FROM STDIN"""
+        import csv
+        import io
+
+        columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([row[column] for column in columns] for row in rows)
+        buffer.seek(0)
+
+        raw_connection = self._engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                column_list = ", ".join(columns)
+                cursor.copy_expert(f"COPY {table.name} ({column_list}) FROM STDIN WITH CSV", buffer)
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+
+_engine_cache: Dict[Any, Engine] = {}
+
+
+def _get_engine(db_uri: str, **options) -> Engine:
+    """
+    Returns an engine for the given db_uri and options, sharing one engine (and thus one
+    connection pool) across datasources constructed with the same uri and options.
+    Options that are not hashable e.g. connect_args dicts fall back to a dedicated engine
+    """
+    try:
+        key = hash((db_uri, tuple(sorted(options.items()))))
+    except TypeError:
+        return create_engine(db_uri, **options)
+
+    engine = _engine_cache.get(key)
+    if engine is None:
+        engine = _engine_cache[key] = create_engine(db_uri, **options)
+    return engine
+
+
+def _is_sqlite_in_memory(db_uri: str) -> bool:
+    """Returns True if the given sqlite uri points to an in-memory database"""
+    return db_uri in ("sqlite://", "sqlite:///") or ":memory:" in db_uri
+
+
+def _is_behind_pgbouncer(options: Dict[str, Any]) -> bool:
+    """
+    Returns True if the database connection is known to go through PgBouncer
+    i.e. the DB_BEHIND_PGBOUNCER environment variable is set to 1
+    or the connection's application_name is set to "pgbouncer"
+    """
+    if os.environ.get("DB_BEHIND_PGBOUNCER", "") == "1":
+        return True
+    return options.get("connect_args", {}).get("application_name") == "pgbouncer"
+
+
+def _register_sqlite_pragmas(engine: Engine):
+    """
+    Sets the pragmas that make sqlite faster for concurrent web workloads
+    i.e. write-ahead logging and fsync only at checkpoints
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
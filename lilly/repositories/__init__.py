@@ -4,6 +4,6 @@ from .base import Repository
 from .sqlalchemy import SQLAlchemyRepository
 
 __all__ = [
-    Repository,
-    SQLAlchemyRepository,
+    "Repository",
+    "SQLAlchemyRepository",
 ]
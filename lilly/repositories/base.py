@@ -4,7 +4,8 @@ Repositories are responsible for data preparation when saving to a data source o
 a data source
 """
 from abc import abstractmethod
-from typing import Any, List, Optional, ContextManager
+from contextlib import nullcontext
+from typing import Any, Iterator, List, Optional, ContextManager
 
 from pydantic import BaseModel
 
@@ -39,7 +40,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def get_one(self, record_id: Any, **kwargs) -> BaseModel:
+    def get_one(self, record_id: Any, connection: Optional[Any] = None, **kwargs) -> BaseModel:
         """
         method to get one record of id `record_id`.
 
@@ -50,7 +51,7 @@ class Repository:
         Returns:
             BaseModel: the record DTO whose ID is `record_id`
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             record = self._get_one(connection, record_id=record_id, **kwargs)
             return self._to_output_dto(record)
 
@@ -89,7 +90,8 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def get_many(self, *criterion, skip: int = 0, limit: Optional[int] = None, **filters) -> List[BaseModel]:
+    def get_many(self, *criterion, skip: int = 0, limit: Optional[int] = None, connection: Optional[Any] = None,
+                 **filters) -> List[BaseModel]:
         """
         method to get many records that fulfil the `criterion` and `filters`.
 
@@ -112,9 +114,27 @@ class Repository:
         Returns:
             list[BaseModel]: the records' DTOs
         """
-        with self._get_connection() as connection:
+        return list(self.iter_get_many(*criterion, skip=skip, limit=limit, connection=connection, **filters))
+
+    def iter_get_many(self,
+                      *criterion,
+                      skip: int = 0,
+                      limit: Optional[int] = None,
+                      connection: Optional[Any] = None,
+                      **filters) -> Iterator[BaseModel]:
+        """
+        generator variant of `get_many` that yields the records' DTOs one by one instead of
+        materializing the whole list, halving peak memory on large result sets.
+
+        It takes the same arguments as `get_many`. The connection stays open until the
+        generator is exhausted or closed
+
+        Yields:
+            BaseModel: the records' DTOs
+        """
+        with self._acquire_connection(connection) as connection:
             records = self._get_many(connection, skip=skip, limit=limit, *criterion, **filters)
-            return [self._to_output_dto(record) for record in records]
+            yield from map(self._to_output_dto, records)
 
     @abstractmethod
     def _create_one(self, datasource_connection: Any, record: BaseModel, **kwargs) -> Any:
@@ -133,7 +153,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def create_one(self, record: BaseModel, **kwargs) -> BaseModel:
+    def create_one(self, record: BaseModel, connection: Optional[Any] = None, **kwargs) -> BaseModel:
         """
         method to create one record.
 
@@ -144,7 +164,7 @@ class Repository:
         Returns:
             BaseModel: the created record DTO
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             record = self._create_one(connection, record=record, **kwargs)
             return self._to_output_dto(record)
 
@@ -165,7 +185,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def create_many(self, records: List[BaseModel], **kwargs) -> List[BaseModel]:
+    def create_many(self, records: List[BaseModel], connection: Optional[Any] = None, **kwargs) -> List[BaseModel]:
         """
         method to create many records.
 
@@ -176,9 +196,9 @@ class Repository:
         Returns:
             list[BaseModel]: the created records' DTOs
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             records = self._create_many(connection, records=records, **kwargs)
-            return [self._to_output_dto(record) for record in records]
+            return list(map(self._to_output_dto, records))
 
     @abstractmethod
     def _update_one(self, datasource_connection: Any, record_id: Any, new_record: BaseModel, **kwargs) -> Any:
@@ -198,7 +218,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def update_one(self, record_id: Any, new_record: BaseModel, **kwargs) -> BaseModel:
+    def update_one(self, record_id: Any, new_record: BaseModel, connection: Optional[Any] = None, **kwargs) -> BaseModel:
         """
         method to update one record of id `record_id`.
 
@@ -210,7 +230,7 @@ class Repository:
         Returns:
             BaseModel: the updated record's DTO
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             record = self._update_one(connection, record_id=record_id, new_record=new_record, **kwargs)
             return self._to_output_dto(record)
 
@@ -242,7 +262,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def update_many(self, new_record: BaseModel, *criterion, **filters) -> List[BaseModel]:
+    def update_many(self, new_record: BaseModel, *criterion, connection: Optional[Any] = None, **filters) -> List[BaseModel]:
         """
         method to update many records that fulfil the `criterion` and `filters`.
 
@@ -264,9 +284,9 @@ class Repository:
         Returns:
             list[BaseModel]: the updated records' DTOs
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             records = self._update_many(connection, new_record, *criterion, **filters)
-            return [self._to_output_dto(record) for record in records]
+            return list(map(self._to_output_dto, records))
 
     @abstractmethod
     def _remove_one(self, datasource_connection: Any, record_id: Any, **kwargs) -> Any:
@@ -285,7 +305,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def remove_one(self, record_id: Any, **kwargs) -> BaseModel:
+    def remove_one(self, record_id: Any, connection: Optional[Any] = None, **kwargs) -> BaseModel:
         """
         method to remove one record of id `record_id`.
 
@@ -296,7 +316,7 @@ class Repository:
         Returns:
             Any: the removed record's DTO
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             record = self._remove_one(connection, record_id=record_id, **kwargs)
             return self._to_output_dto(record)
 
@@ -327,7 +347,7 @@ class Repository:
         """
         raise NotImplementedError()
 
-    def remove_many(self, *criterion, **filters) -> List[BaseModel]:
+    def remove_many(self, *criterion, connection: Optional[Any] = None, **filters) -> List[BaseModel]:
         """
         method to remove many records that fulfil the `criterion` and `filters`.
 
@@ -348,9 +368,9 @@ class Repository:
         Returns:
             list[BaseModel]: the removed records' DTOs
         """
-        with self._get_connection() as connection:
+        with self._acquire_connection(connection) as connection:
             records = self._remove_many(connection, *criterion, **filters)
-            return [self._to_output_dto(record) for record in records]
+            return list(map(self._to_output_dto, records))
 
     @property
     @abstractmethod
@@ -363,6 +383,15 @@ class Repository:
         """Converts the given data into the appropriate data transfer object"""
         raise NotImplementedError()
 
+    def _acquire_connection(self, connection: Optional[Any] = None) -> ContextManager:
+        """
+        Context manager that yields the given connection if one is passed, or opens
+        a fresh one from the data source for the duration of the block
+        """
+        if connection is not None:
+            return nullcontext(connection)
+        return self._get_connection()
+
     def _get_connection(self) -> ContextManager:
         """
         Returns the context manager to the connection to the data source by calling `DataSource.connect()`
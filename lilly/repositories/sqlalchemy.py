@@ -2,11 +2,13 @@
 SQLAlchemyRepository, available for inheritance
 """
 from abc import abstractmethod
-from typing import Any, Type, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Type, Iterable, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
-from sqlalchemy.orm import DeclarativeMeta, Session
-from sqlalchemy import insert, select, update, delete, text
+from sqlalchemy.orm import DeclarativeMeta, Session, selectinload
+from sqlalchemy import insert, inspect, select, update, delete, text
 
 from .base import Repository
 from lilly.datasources import SQLAlchemyDataSource
@@ -14,6 +16,10 @@ from lilly.datasources import SQLAlchemyDataSource
 
 class SQLAlchemyRepository(Repository):
     """Repository for saving and retrieving random names"""
+    _batch_size: int = 1000
+    # relationships (attribute names or InstrumentedAttribute's) to always eager-load
+    # with selectinload so that DTO conversion never triggers a lazy load per row
+    _eager_relationships: Sequence = ()
 
     @property
     @abstractmethod
@@ -33,10 +39,12 @@ class SQLAlchemyRepository(Repository):
         raise NotImplementedError("a datasource that is an SQLAlchemyDataSource needs to be returned from _datasource")
 
     def _to_output_dto(self, record: Any) -> BaseModel:
-        return self._dto_cls.from_orm(record)
+        dto_cls = self._dto_cls
+        return dto_cls.construct(**{field: getattr(record, field) for field in _get_dto_fields(dto_cls)})
 
     def _get_one(self, datasource_connection: Session, record_id: Any, **kwargs) -> DeclarativeMeta:
-        return datasource_connection.query(self._model_cls).get(record_id)
+        eager_options = self.__get_eager_options()
+        return datasource_connection.get(self._model_cls, record_id, options=eager_options or None)
 
     def create_many(self, records: List[BaseModel], **kwargs) -> List[Any]:
         """
@@ -60,16 +68,30 @@ class SQLAlchemyRepository(Repository):
                   *criterion,
                   skip: int = 0,
                   limit: Optional[int] = None,
-                  **filters) -> List[DeclarativeMeta]:
+                  **filters) -> Iterable[DeclarativeMeta]:
+        """
+        In addition to the base filters, a `load_relations` key-word argument (a tuple of
+        relationship names) can be passed to eager-load those relationships with
+        selectinload and avoid one query per row when the DTO reads them
+
+        Plain queries stream their rows in batches of `_batch_size` via yield_per rather
+        than materializing the whole result set before conversion starts
+        """
         coerced_criteria = self.__coerce_string_criteria(*criterion)
+        eager_options = self.__get_eager_options(filters.pop("load_relations", ()))
 
         query = datasource_connection.query(self._model_cls).filter(*coerced_criteria).filter_by(**filters).offset(skip)
 
+        if eager_options:
+            query = query.options(*eager_options)
+
         if limit is not None:
             query = query.limit(limit)
 
-        data = query.all()
-        return data
+        if eager_options:
+            return query.all()
+
+        return query.yield_per(self._batch_size)
 
     def _create_one(self, datasource_connection: Session, record: BaseModel, **kwargs) -> DeclarativeMeta:
         record = self._model_cls(**record.dict())
@@ -81,7 +103,14 @@ class SQLAlchemyRepository(Repository):
         DeclarativeMeta]:
         stmt = insert(self._model_cls)
 
-        datasource_connection.execute(stmt, [record.dict() for record in records])
+        # plain mappings go straight to the executemany path, skipping one
+        # .dict() round-trip per row for callers that already hold dicts
+        rows = (record.dict() if isinstance(record, BaseModel) else dict(record) for record in records)
+        while True:
+            page = list(islice(rows, self._batch_size))
+            if not page:
+                break
+            datasource_connection.execute(stmt, page)
         datasource_connection.commit()
 
         # return empty because it is currently quite hard to return the inserted records with their data
@@ -90,14 +119,27 @@ class SQLAlchemyRepository(Repository):
 
     def _update_one(self, datasource_connection: Any, record_id: Any, new_record: BaseModel,
                     **kwargs) -> DeclarativeMeta:
-        record = datasource_connection.query(self._model_cls).get(record_id)
+        if self.__supports_full_returning(datasource_connection):
+            stmt = update(self._model_cls).where(self.__get_primary_key() == record_id) \
+                .values(**new_record.dict(exclude_unset=True)) \
+                .returning(*self._model_cls.__table__.columns) \
+                .execution_options(synchronize_session=False)
+
+            record = datasource_connection.execute(stmt).one_or_none()
+            if record is None:
+                raise KeyError(f"record with id: {record_id} not found")
+
+            datasource_connection.commit()
+            return record
+
+        record = datasource_connection.get(self._model_cls, record_id)
         if record is None:
             raise KeyError(f"record with id: {record_id} not found")
 
-        for field, value in iter(new_record):
-            setattr(record, field, value)
+        for field, value in new_record.dict(exclude_unset=True).items():
+            if getattr(record, field) != value:
+                setattr(record, field, value)
 
-        datasource_connection.add(record)
         datasource_connection.commit()
         return record
 
@@ -106,19 +148,40 @@ class SQLAlchemyRepository(Repository):
         coerced_criteria = self.__coerce_string_criteria(*criterion)
         new_data = new_record.dict()
 
-        stmt = update(self._model_cls).filter(*coerced_criteria).filter_by(**filters).values(new_data) \
-            .execution_options(synchronize_session="fetch")
+        stmt = update(self._model_cls).filter(*coerced_criteria).filter_by(**filters).values(new_data)
 
-        affected_records = self._get_affected_records(
-            datasource_connection, *coerced_criteria, new_data=new_data, **filters)
+        if self.__supports_full_returning(datasource_connection):
+            stmt = stmt.returning(*self._model_cls.__table__.columns).execution_options(synchronize_session=False)
+            affected_records = datasource_connection.execute(stmt).all()
+            datasource_connection.commit()
+            return affected_records
 
-        datasource_connection.execute(stmt)
+        primary_key = self.__get_primary_key()
+        affected_ids = datasource_connection.execute(
+            select(primary_key).filter(*coerced_criteria).filter_by(**filters)
+        ).scalars().all()
+
+        datasource_connection.execute(stmt.execution_options(synchronize_session=False))
         datasource_connection.commit()
 
-        return affected_records
+        return datasource_connection.execute(
+            select(self._model_cls).where(primary_key.in_(affected_ids)).execution_options(populate_existing=True)
+        ).scalars().all()
 
     def _remove_one(self, datasource_connection: Session, record_id: Any, **kwargs) -> DeclarativeMeta:
-        record = datasource_connection.query(self._model_cls).get(record_id)
+        if self.__supports_full_returning(datasource_connection):
+            stmt = delete(self._model_cls).where(self.__get_primary_key() == record_id) \
+                .returning(*self._model_cls.__table__.columns) \
+                .execution_options(synchronize_session=False)
+
+            record = datasource_connection.execute(stmt).one_or_none()
+            if record is None:
+                raise KeyError(f"record with id: {record_id} not found")
+
+            datasource_connection.commit()
+            return record
+
+        record = datasource_connection.get(self._model_cls, record_id)
         if record is None:
             raise KeyError(f"record with id: {record_id} not found")
         datasource_connection.delete(record)
@@ -128,8 +191,15 @@ class SQLAlchemyRepository(Repository):
     def _remove_many(self, datasource_connection: Session, *criterion, **filters) -> List[DeclarativeMeta]:
         coerced_criteria = self.__coerce_string_criteria(*criterion)
 
-        stmt = delete(self._model_cls).filter(*coerced_criteria).filter_by(**filters) \
-            .execution_options(synchronize_session="fetch")
+        stmt = delete(self._model_cls).filter(*coerced_criteria).filter_by(**filters)
+
+        if self.__supports_full_returning(datasource_connection):
+            stmt = stmt.returning(*self._model_cls.__table__.columns).execution_options(synchronize_session=False)
+            affected_records = datasource_connection.execute(stmt).all()
+            datasource_connection.commit()
+            return affected_records
+
+        stmt = stmt.execution_options(synchronize_session="fetch")
         affected_records = self._get_affected_records(
             datasource_connection, *coerced_criteria, **filters)
 
@@ -141,20 +211,34 @@ class SQLAlchemyRepository(Repository):
     def _get_affected_records(self,
                               datasource_connection: Session,
                               *criterion,
-                              new_data: Optional[Dict[str, Any]] = None,
                               **filters):
-        """
-        Gets the records that are affected by the given criteria and filters,
-        and updated them with new data if new_data is set
-        """
-        affected_records = datasource_connection.execute(
+        """Gets the records that are affected by the given criteria and filters"""
+        return datasource_connection.execute(
             select(self._model_cls).filter(*criterion).filter_by(**filters)
         ).scalars().all()
 
-        if new_data is not None:
-            return [_update_orm_instance(record, new_data=new_data) for record in affected_records]
+    def __get_primary_key(self):
+        """Returns the primary key column of the model class"""
+        return inspect(self._model_cls).primary_key[0]
 
-        return affected_records
+    @staticmethod
+    def __supports_full_returning(datasource_connection: Session) -> bool:
+        """
+        Returns True if the database can RETURN the affected rows straight from
+        bulk UPDATE/DELETE statements e.g. postgresql; dialects that cannot fall
+        back to an extra SELECT of the affected records before mutating them
+        """
+        return datasource_connection.bind.dialect.full_returning
+
+    def __get_eager_options(self, load_relations: Sequence = ()) -> List[Any]:
+        """
+        Builds the selectinload options for `_eager_relationships` plus any extra
+        `load_relations`, resolving relationship names to model attributes
+        """
+        return [
+            selectinload(getattr(self._model_cls, relation) if isinstance(relation, str) else relation)
+            for relation in (*self._eager_relationships, *load_relations)
+        ]
 
     @staticmethod
     def __coerce_string_criteria(*criteria):
@@ -164,11 +248,19 @@ class SQLAlchemyRepository(Repository):
         e.g.::
          "title LIKE '%t'" becomes text("title LIKE '%t'")
         """
-        return [text(criterion) if isinstance(criterion, str) else criterion for criterion in criteria]
+        return [_get_text_clause(criterion) if isinstance(criterion, str) else criterion for criterion in criteria]
+
+
+@lru_cache(maxsize=512)
+def _get_text_clause(criterion: str):
+    """
+    Returns the text() clause for the given string criterion, parsed once per
+    unique string so that repeated searches e.g. typeahead reuse the clause
+    """
+    return text(criterion)
 
 
-def _update_orm_instance(orm_instance: DeclarativeMeta, new_data: Dict[str, Any]):
-    """Updates the orm instance in place and returns it"""
-    for field, value in new_data.items():
-        setattr(orm_instance, field, value)
-    return orm_instance
+@lru_cache(maxsize=None)
+def _get_dto_fields(dto_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Returns the field names of the given DTO class, computed once per class"""
+    return tuple(dto_cls.__fields__)
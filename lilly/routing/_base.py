@@ -15,6 +15,7 @@ class RouteSet:
       all having the same signature as normal FastAPI route decorators
     - Any dependencies can be passed in as class attributes
     """
+    __slots__ = ()
 
     @staticmethod
     def _do(action_cls: Type[Action], *args, **kwargs):
@@ -1,9 +1,12 @@
 """Module containing REST RouteSet for CRUD-related actions"""
 from abc import abstractmethod
-from typing import Type, List, Optional, Any
+from functools import lru_cache
+from typing import Type, List, Optional, Any, Tuple
 
 from fastapi import APIRouter
 from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 
 from lilly.actions import (
     CreateOneAction,
@@ -58,6 +61,7 @@ class CRUDRouteSet(RouteSet):
     """
     Base Routeset for CRUD route sets
     """
+    __slots__ = ()
 
     @classmethod
     @abstractmethod
@@ -74,6 +78,22 @@ class CRUDRouteSet(RouteSet):
 def _generate_crud_route_set(router: APIRouter, cls: Type[CRUDRouteSet]) -> Type[CRUDRouteSet]:
     _settings = cls.get_settings()
 
+    # bind the per-request settings lookups to closure variables once at class build
+    # time so that each handler reads a cell variable instead of an attribute
+    _response_model = _settings.response_model
+    _response_list_model = List[_settings.response_model]
+    _creation_request_model = _settings.creation_request_model
+    _creation_request_list_model = List[_settings.creation_request_model]
+    _searchable_fields = _settings.string_searchable_fields
+    _create_one_action = _settings.create_one_action
+    _create_many_action = _settings.create_many_action
+    _read_one_action = _settings.read_one_action
+    _read_many_action = _settings.read_many_action
+    _update_one_action = _settings.update_one_action
+    _update_many_action = _settings.update_many_action
+    _delete_one_action = _settings.delete_one_action
+    _delete_many_action = _settings.delete_many_action
+
     class _CRUDRouteSet(cls):
         """The CRUD routeset"""
 
@@ -81,49 +101,47 @@ def _generate_crud_route_set(router: APIRouter, cls: Type[CRUDRouteSet]) -> Type
         def get_settings(cls) -> CRUDRouteSetSettings:
             return _settings
 
-        @router.post(f"{_settings.base_path}/", response_model=_settings.response_model)
-        def create_one(self, body: _settings.creation_request_model):
-            return self._do(_settings.create_one_action, body)
+        @router.post(f"{_settings.base_path}/", response_model=_response_model)
+        def create_one(self, body: _creation_request_model):
+            return self._do(_create_one_action, body)
 
-        @router.post(f"{_settings.base_path_for_multiple_items}/", response_model=List[_settings.response_model])
-        def create_many(self, body: List[_settings.creation_request_model]):
-            return self._do(_settings.create_many_action, body)
+        @router.post(f"{_settings.base_path_for_multiple_items}/", response_model=_response_list_model)
+        def create_many(self, body: _creation_request_list_model):
+            return self._do(_create_many_action, body)
 
-        @router.get(f"{_settings.base_path}/{{record_id}}", response_model=_settings.response_model)
+        @router.get(f"{_settings.base_path}/{{record_id}}", response_model=_response_model)
         def read_one(self, record_id: _settings.id_type):
-            return self._do(_settings.read_one_action, record_id)
+            return self._do(_read_one_action, record_id)
 
-        @router.get(f"{_settings.base_path}/", response_model=List[_settings.response_model])
+        @router.get(f"{_settings.base_path}/", response_model=_response_list_model)
         def read_many(self, skip: int = 0, limit: Optional[int] = None, q: Optional[str] = None):
-            criteria = []
-
-            if q is not None:
-                query = _extract_sql_query_string(fields=_settings.string_searchable_fields, q=q)
-                criteria.append(query)
+            if q is None:
+                return self._do(_read_many_action, skip=skip, limit=limit, )
 
-            return self._do(_settings.read_many_action, *criteria, skip=skip, limit=limit, )
+            query = _extract_sql_query_string(fields=_searchable_fields, q=q)
+            return self._do(_read_many_action, query, skip=skip, limit=limit, )
 
-        @router.put(f"{_settings.base_path}/{{record_id}}", response_model=_settings.response_model)
-        def update_one(self, record_id: _settings.id_type, body: _settings.response_model):
-            return self._do(_settings.update_one_action, record_id, body)
+        @router.put(f"{_settings.base_path}/{{record_id}}", response_model=_response_model)
+        def update_one(self, record_id: _settings.id_type, body: _response_model):
+            return self._do(_update_one_action, record_id, body)
 
-        @router.patch(f"{_settings.base_path}/{{record_id}}", response_model=_settings.response_model)
-        def update_partial(self, record_id: _settings.id_type, body: _settings.creation_request_model):
-            return self._do(_settings.update_one_action, record_id, body)
+        @router.patch(f"{_settings.base_path}/{{record_id}}", response_model=_response_model)
+        def update_partial(self, record_id: _settings.id_type, body: _creation_request_model):
+            return self._do(_update_one_action, record_id, body)
 
-        @router.put(f"{_settings.base_path_for_multiple_items}/", response_model=List[_settings.response_model])
-        def update_many(self, body: _settings.creation_request_model, q: str = ""):
-            query = _extract_sql_query_string(fields=_settings.string_searchable_fields, q=q)
-            return self._do(_settings.update_many_action, body, query, )
+        @router.put(f"{_settings.base_path_for_multiple_items}/", response_model=_response_list_model)
+        def update_many(self, body: _creation_request_model, q: str = ""):
+            query = _extract_sql_query_string(fields=_searchable_fields, q=q)
+            return self._do(_update_many_action, body, query, )
 
-        @router.delete(f"{_settings.base_path}/{{record_id}}", response_model=_settings.response_model)
+        @router.delete(f"{_settings.base_path}/{{record_id}}", response_model=_response_model)
         def delete_one(self, record_id: _settings.id_type):
-            return self._do(_settings.delete_one_action, record_id)
+            return self._do(_delete_one_action, record_id)
 
-        @router.delete(f"{_settings.base_path_for_multiple_items}/", response_model=List[_settings.response_model])
+        @router.delete(f"{_settings.base_path_for_multiple_items}/", response_model=_response_list_model)
         def delete_many(self, q: str = ""):
-            query = _extract_sql_query_string(fields=_settings.string_searchable_fields, q=q)
-            return self._do(_settings.delete_many_action, query, )
+            query = _extract_sql_query_string(fields=_searchable_fields, q=q)
+            return self._do(_delete_many_action, query, )
 
     _remove_routes_for_undefined_actions(_CRUDRouteSet, settings=_settings)
 
@@ -131,11 +149,21 @@ def _generate_crud_route_set(router: APIRouter, cls: Type[CRUDRouteSet]) -> Type
 
 
 def _extract_sql_query_string(fields: List[str], q: str):
-    """Generates the search query to be sent to the repository for filtering using SQL-like syntax"""
-    str_search = ""
-    for field in fields:
-        str_search += f"{field} LIKE '%{q}%' OR"
-    return str_search.rstrip(" OR")
+    """
+    Generates the search query to be sent to the repository for filtering using SQL-like syntax
+
+    The search term is passed as a bound parameter, never interpolated into the SQL,
+    and the clause itself is parsed once per unique set of fields
+    """
+    if not fields:
+        return ""
+    return _get_search_clause(tuple(fields)).bindparams(q=f"%{q}%")
+
+
+@lru_cache(maxsize=None)
+def _get_search_clause(fields: Tuple[str, ...]) -> TextClause:
+    """Returns the parameterized LIKE clause for the given fields, built once per unique tuple"""
+    return text(" OR ".join(f"{field} LIKE :q" for field in fields))
 
 
 def _remove_routes_for_undefined_actions(cls: Type[CRUDRouteSet], settings: CRUDRouteSetSettings):
@@ -4,6 +4,7 @@ These are the business logic components called by routes to do a specific task b
 """
 import random
 import string
+from functools import lru_cache
 
 from pydantic import BaseModel
 
@@ -23,7 +24,10 @@ from lilly.repositories import Repository
 from .dtos import NameCreationRequestDTO
 from .repositories import NamesRepository
 
-_names_repo = NamesRepository()
+@lru_cache(maxsize=1)
+def _get_names_repo() -> NamesRepository:
+    """Returns the shared NamesRepository, created lazily on first use"""
+    return NamesRepository()
 
 
 class GenerateRandomName(Action):
@@ -39,17 +43,14 @@ class GenerateRandomName(Action):
     def run(self) -> BaseModel:
         """Actual method that is run"""
         name = self._generate_random_word()
-        return _names_repo.create_one(NameCreationRequestDTO(title=name))
+        return _get_names_repo().create_one(NameCreationRequestDTO(title=name))
 
     def _generate_random_word(self):
-        """Generates a random word"""
-        word = ""
-        for i in range(self._length):
-            if i % 2 == 0:
-                word += random.choice(self._consonants)
-            else:
-                word += random.choice(self._vowels)
-        return word
+        """Generates a random word of alternating consonants and vowels"""
+        consonants = random.choices(self._consonants, k=(self._length + 1) // 2)
+        vowels = random.choices(self._vowels, k=self._length // 2)
+        vowels.append("")
+        return "".join(consonant + vowel for consonant, vowel in zip(consonants, vowels))
 
 
 class CreateOneName(CreateOneAction):
@@ -57,7 +58,7 @@ class CreateOneName(CreateOneAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class CreateManyNames(CreateManyAction):
@@ -65,7 +66,7 @@ class CreateManyNames(CreateManyAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class ReadOneName(ReadOneAction):
@@ -73,7 +74,7 @@ class ReadOneName(ReadOneAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class ReadManyNames(ReadManyAction):
@@ -81,7 +82,7 @@ class ReadManyNames(ReadManyAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class UpdateOneName(UpdateOneAction):
@@ -89,7 +90,7 @@ class UpdateOneName(UpdateOneAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class UpdateManyNames(UpdateManyAction):
@@ -97,7 +98,7 @@ class UpdateManyNames(UpdateManyAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class DeleteOneName(DeleteOneAction):
@@ -105,7 +106,7 @@ class DeleteOneName(DeleteOneAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
 
 
 class DeleteManyNames(DeleteManyAction):
@@ -115,4 +116,4 @@ class DeleteManyNames(DeleteManyAction):
 
     @property
     def _repository(self) -> Repository:
-        return _names_repo
+        return _get_names_repo()
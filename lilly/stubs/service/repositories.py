@@ -1,7 +1,7 @@
 """
 Module containing repositories that the Actions use to persist data or to retrieve it
 """
-from typing import Type
+from typing import Optional, Type
 
 from pydantic import BaseModel
 from sqlalchemy import Column, Integer, String
@@ -22,7 +22,8 @@ class Name(Base):
 
 class NamesRepository(SQLAlchemyRepository):
     """Repository for saving and retrieving random names"""
-    _names_db = NamesDb()
+    # created lazily on first use so that importing this module does not connect to the database
+    _names_db: Optional[NamesDb] = None
 
     @property
     def _model_cls(self) -> Type[DeclarativeMeta]:
@@ -34,4 +35,6 @@ class NamesRepository(SQLAlchemyRepository):
 
     @property
     def _datasource(self) -> SQLAlchemyDataSource:
-        return self._names_db
+        if NamesRepository._names_db is None:
+            NamesRepository._names_db = NamesDb()
+        return NamesRepository._names_db
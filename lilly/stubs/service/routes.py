@@ -29,6 +29,7 @@ class NormalRouteSet(RouteSet):
     A basic Class based route that can have any method as an endpoint and can have common variables in the init
     attached to self
     """
+    __slots__ = ("name",)
 
     def __init__(self):
         self.name = "Lilly"
@@ -49,6 +50,7 @@ class HelloWorld(CRUDRouteSet):
     """
     Class Based Route set that handles CRUD functionality out of the box
     """
+    __slots__ = ()
 
     @classmethod
     def get_settings(cls) -> CRUDRouteSetSettings:
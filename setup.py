@@ -24,6 +24,7 @@ setup(
         "Programming Language :: Python :: 3.7",
     ],
     packages=find_packages(exclude=("test",)),
+    python_requires=">=3.7",
     include_package_data=True,
     install_requires=["fastapi", "click", "pydantic", "fastapi-utils", "SQLAlchemy"],
     entry_points={
@@ -1,4 +1,5 @@
 """Module containing mocks of all relevant internal classes"""
+from contextlib import contextmanager
 from typing import Any, List, ContextManager, Dict
 
 from pydantic import BaseModel
@@ -32,17 +33,10 @@ class NameTestCreationDTO(BaseModel):
     title: str
 
 
-class MockConnectionContextManager:
-    """A mock context manager for the connection to a data source"""
-
-    def __init__(self, connection: Any):
-        self._connection = connection
-
-    def __enter__(self):
-        return self._connection
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+@contextmanager
+def MockConnectionContextManager(connection: Any):
+    """A mock context manager for the connection to a data source; single-use like a real one"""
+    yield connection
 
 
 class MockDataSource(DataSource):
@@ -0,0 +1,13 @@
+"""Module containing the declarative base and models shared by the database-backed tests"""
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class NameTest(Base):
+    """Model for names"""
+    __tablename__ = "names"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
@@ -1,21 +1,33 @@
 """Tests for the base Repository class"""
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, PropertyMock, patch, call
 
-from lilly.datasources import DataSource
 from lilly.repositories import Repository
 from test.assets.mock_internals import MockConnectionContextManager
 
+# shared by the batch (xxx_many) tests; built once instead of inside every assertion
+_BATCH_RECORDS = ["_record", "_another"]
+_EXPECTED_BATCH_CALLS = [call(record) for record in _BATCH_RECORDS]
+_EXPECTED_BATCH_DTOS = ["to_output_dto" for _ in _BATCH_RECORDS]
+
 
 class TestRepository(unittest.TestCase):
     """Tests related to the repository-related code"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Builds the shared datasource mock once; MagicMock construction is surprisingly costly"""
+        cls.connection = "connected"
+        # only .connect is ever referenced, so a namespace is enough in place of a DataSource;
+        # side_effect builds a fresh context manager per call since generator ones are single-use
+        cls.mock_datasource = SimpleNamespace(
+            connect=MagicMock(side_effect=lambda: MockConnectionContextManager(cls.connection)))
+
     def setUp(self) -> None:
-        """Initialize some common variables"""
-        self.connection = "connected"
-        self.mock_datasource = DataSource()
-        self.mock_datasource.connect = MagicMock(return_value=MockConnectionContextManager(self.connection))
+        """Clears any calls the previous test recorded on the shared mock"""
+        self.mock_datasource.connect.reset_mock()
 
     @patch("lilly.repositories.Repository._datasource", new_callable=PropertyMock)
     def test_get_one(self, mock_repo_datasource: PropertyMock):
@@ -40,12 +52,10 @@ class TestRepository(unittest.TestCase):
     def test_get_many(self, mock_repo_datasource: PropertyMock):
         """get_many calls _get_many with datasource_connection got from self._datasource.connect()"""
         mock_repo_datasource.return_value = self.mock_datasource
-        items = ["_get_many", "_another"]
-        item_dto = "to_output_dto"
 
         mock_repo = Repository()
-        mock_repo._to_output_dto = MagicMock(return_value=item_dto)
-        mock_repo._get_many = MagicMock(return_value=items)
+        mock_repo._to_output_dto = MagicMock(return_value="to_output_dto")
+        mock_repo._get_many = MagicMock(return_value=_BATCH_RECORDS)
         random_kwargs = {"hello": "world", "yei": "yoohoo"}
         skip = 6
         limit = 4
@@ -55,8 +65,8 @@ class TestRepository(unittest.TestCase):
 
         mock_repo._get_many.assert_called_with(self.connection, skip=skip, limit=limit, filters=filters,
                                                **random_kwargs)
-        mock_repo._to_output_dto.assert_has_calls([call(item) for item in items])
-        self.assertListEqual(values, [item_dto for _ in items])
+        mock_repo._to_output_dto.assert_has_calls(_EXPECTED_BATCH_CALLS)
+        self.assertListEqual(values, _EXPECTED_BATCH_DTOS)
 
     @patch("lilly.repositories.Repository._datasource", new_callable=PropertyMock)
     def test_update_one(self, mock_repo_datasource: PropertyMock):
@@ -83,12 +93,10 @@ class TestRepository(unittest.TestCase):
     def test_update_many(self, mock_repo_datasource: PropertyMock):
         """update_many calls _update_many with datasource_connection got from self._datasource.connect()"""
         mock_repo_datasource.return_value = self.mock_datasource
-        items = ["_update_many", "_another"]
-        item_dto = "to_output_dto"
 
         mock_repo = Repository()
-        mock_repo._to_output_dto = MagicMock(return_value=item_dto)
-        mock_repo._update_many = MagicMock(return_value=items)
+        mock_repo._to_output_dto = MagicMock(return_value="to_output_dto")
+        mock_repo._update_many = MagicMock(return_value=_BATCH_RECORDS)
         random_kwargs = {"hello": "world", "yei": "yoohoo"}
         new_record = "stuff"
         filters = {"some": "stuff"}
@@ -97,8 +105,8 @@ class TestRepository(unittest.TestCase):
 
         mock_repo._update_many.assert_called_with(
             self.connection, new_record, filters=filters, **random_kwargs)
-        mock_repo._to_output_dto.assert_has_calls([call(item) for item in items])
-        self.assertListEqual(values, [item_dto for _ in items])
+        mock_repo._to_output_dto.assert_has_calls(_EXPECTED_BATCH_CALLS)
+        self.assertListEqual(values, _EXPECTED_BATCH_DTOS)
 
     @patch("lilly.repositories.Repository._datasource", new_callable=PropertyMock)
     def test_remove_one(self, mock_repo_datasource: PropertyMock):
@@ -123,20 +131,18 @@ class TestRepository(unittest.TestCase):
     def test_remove_many(self, mock_repo_datasource: PropertyMock):
         """remove_many calls _remove_many with datasource_connection got from self._datasource.connect()"""
         mock_repo_datasource.return_value = self.mock_datasource
-        items = ["_remove_many", "_another"]
-        item_dto = "to_output_dto"
 
         mock_repo = Repository()
-        mock_repo._to_output_dto = MagicMock(return_value=item_dto)
-        mock_repo._remove_many = MagicMock(return_value=items)
+        mock_repo._to_output_dto = MagicMock(return_value="to_output_dto")
+        mock_repo._remove_many = MagicMock(return_value=_BATCH_RECORDS)
         random_kwargs = {"hello": "world", "yei": "yoohoo"}
         filters = {"some": "stuff"}
 
         values = mock_repo.remove_many(filters=filters, **random_kwargs)
 
         mock_repo._remove_many.assert_called_with(self.connection, filters=filters, **random_kwargs)
-        mock_repo._to_output_dto.assert_has_calls([call(item) for item in items])
-        self.assertListEqual(values, [item_dto for _ in items])
+        mock_repo._to_output_dto.assert_has_calls(_EXPECTED_BATCH_CALLS)
+        self.assertListEqual(values, _EXPECTED_BATCH_DTOS)
 
     @patch("lilly.repositories.Repository._datasource", new_callable=PropertyMock)
     def test_create_one(self, mock_repo_datasource: PropertyMock):
@@ -160,19 +166,17 @@ class TestRepository(unittest.TestCase):
     def test_create_many(self, mock_repo_datasource: PropertyMock):
         """create_many calls _create_many with datasource_connection got from self._datasource.connect()"""
         mock_repo_datasource.return_value = self.mock_datasource
-        items = ["_create_many", "_another"]
-        item_dto = "to_output_dto"
 
         mock_repo = Repository()
-        mock_repo._to_output_dto = MagicMock(return_value=item_dto)
-        mock_repo._create_many = MagicMock(return_value=items)
+        mock_repo._to_output_dto = MagicMock(return_value="to_output_dto")
+        mock_repo._create_many = MagicMock(return_value=_BATCH_RECORDS)
         random_kwargs = {"hello": "world", "yei": "yoohoo"}
 
-        values = mock_repo.create_many(records=items, **random_kwargs)
+        values = mock_repo.create_many(records=_BATCH_RECORDS, **random_kwargs)
 
-        mock_repo._create_many.assert_called_with(self.connection, records=items, **random_kwargs)
-        mock_repo._to_output_dto.assert_has_calls([call(item) for item in items])
-        self.assertListEqual(values, [item_dto for _ in items])
+        mock_repo._create_many.assert_called_with(self.connection, records=_BATCH_RECORDS, **random_kwargs)
+        mock_repo._to_output_dto.assert_has_calls(_EXPECTED_BATCH_CALLS)
+        self.assertListEqual(values, _EXPECTED_BATCH_DTOS)
 
     def test_required_datasource_attribute(self):
         """Throws NotImplementedError when used without _datasource defined on the class"""
@@ -1,32 +1,57 @@
 """Tests for the SQLAlchemyRepository code"""
 import os
 import unittest
-from typing import Type, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, Type, List, Dict, Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from sqlalchemy import Column, Integer, String, Table
-from sqlalchemy.orm import declarative_base, DeclarativeMeta
+from sqlalchemy import Table, select, text
+from sqlalchemy.orm import DeclarativeMeta
 
 from lilly.datasources import SQLAlchemyDataSource
 from lilly.repositories import SQLAlchemyRepository
 from test.assets.mock_internals import NameTestDTO, MOCK_NAME_RECORDS, NameTestCreationDTO
+from test.assets.schema import Base, NameTest
 
-root_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-test_env_path = os.path.join(root_path, ".env")
-load_dotenv(test_env_path)
 
-Base = declarative_base()
+@lru_cache(maxsize=1)
+def _get_test_database_url() -> Optional[str]:
+    """
+    Returns the test database url, parsing the .env file only when the variable
+    is not already in the environment e.g. on CI, and only once per process
+    """
+    if "TEST_DATABASE_URL" not in os.environ:
+        root_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        load_dotenv(os.path.join(root_path, ".env"))
+    return os.environ.get("TEST_DATABASE_URL")
+
 
 sqlite_test_db = SQLAlchemyDataSource(declarative_meta=Base, db_uri="sqlite://")
-pq_test_db = SQLAlchemyDataSource(declarative_meta=Base, db_uri=os.environ.get("TEST_DATABASE_URL"))
+pq_test_db = SQLAlchemyDataSource(declarative_meta=Base, db_uri=_get_test_database_url())
+
+
+# built once so the ORDER BY query used by several helpers compiles a single clause tree;
+# a core column select keeps the read-back rows out of the ORM identity map
+_NAMES_BY_ID_QUERY = select(NameTest.id, NameTest.title).order_by(NameTest.id)
+
+
+def _get_all_names(session) -> List[NameTestDTO]:
+    """Reads back all name rows in id order as DTOs, via the dict fast path instead of from_orm"""
+    return [NameTestDTO(**row) for row in session.execute(_NAMES_BY_ID_QUERY).mappings().all()]
 
 
-class NameTest(Base):
-    __tablename__ = "names"
-    id = Column(Integer, primary_key=True)
-    title = Column(String, nullable=False)
+def setUpModule():
+    """Creates the schema once for the whole module; each test only wipes rows"""
+    sqlite_test_db.initialize_db()
+    pq_test_db.initialize_db()
+
+
+def tearDownModule():
+    """Drops the tables created for this module"""
+    sqlite_test_db.clear_db()
+    pq_test_db.clear_db()
 
 
 class NamesTestRepository(SQLAlchemyRepository):
@@ -52,64 +77,78 @@ class TestSQLAlchemyRepository(unittest.TestCase):
     """Tests related to the repository-related code"""
 
     def setUp(self) -> None:
-        """Initialize some common variables"""
-        sqlite_test_db.clear_db()
-        sqlite_test_db.initialize_db()
-
-        pq_test_db.clear_db()
-        pq_test_db.initialize_db()
+        """Initialize some common variables, starting each test with empty tables"""
+        for test_db in (sqlite_test_db, pq_test_db):
+            with test_db.connect() as session:
+                if session.bind.dialect.name == "postgresql":
+                    # also restart the id sequence so each test sees ids from 1
+                    session.execute(text(f"TRUNCATE TABLE {NameTest.__tablename__} RESTART IDENTITY"))
+                else:
+                    session.execute(NameTest.__table__.delete())
+                session.commit()
 
         self.sqlite_name_repo = NamesTestRepository(sqlite_test_db)
         self.pq_name_repo = NamesTestRepository(pq_test_db)
 
+    def _get_repos(self):
+        """Pairs each repository with a label so subTest reports which leg failed"""
+        return ("sqlite", self.sqlite_name_repo), ("postgres", self.pq_name_repo)
+
     @staticmethod
     def _add_dummy_data(db_source: SQLAlchemyDataSource, records: List[Dict[str, Any]]):
         """Adds dummy data to the database"""
         with db_source.connect() as db:
             names_table: Table = NameTest.__table__
-            stmt = names_table.insert().values(records)
-            db.execute(stmt)
+            db.execute(names_table.insert(), records)
             db.commit()
 
     def test_get_one(self):
         """get_one returns a single record of given id from the database"""
-        self._test_get_one(self.sqlite_name_repo)
-        self._test_get_one(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_get_one(repo)
 
     def test_get_many(self):
         """get_many returns a list of records that fulfill given criteria and filters"""
-        self._test_get_many(self.sqlite_name_repo)
-        self._test_get_many(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_get_many(repo)
 
     def test_update_one(self):
         """update_one updates the record of record_id passed"""
-        self._test_update_one(self.sqlite_name_repo)
-        self._test_update_one(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_update_one(repo)
 
     def test_update_many(self):
         """update_many updates many records that fulfill the criteria and filters"""
-        self._test_update_many(self.sqlite_name_repo)
-        self._test_update_many(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_update_many(repo)
 
     def test_remove_one(self):
         """remove_one removes the record with the given record_id"""
-        self._test_remove_one(self.sqlite_name_repo)
-        self._test_remove_one(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_remove_one(repo)
 
     def test_remove_many(self):
         """remove_many removes the records that fulfill the given criteria and filters"""
-        self._test_remove_many(self.sqlite_name_repo)
-        self._test_remove_many(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_remove_many(repo)
 
     def test_create_one(self):
         """create_one creates a record in the database"""
-        self._test_create_one(self.sqlite_name_repo)
-        self._test_create_one(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_create_one(repo)
 
     def test_create_many(self):
         """create_many creates many records in the database"""
-        self._test_create_many(self.sqlite_name_repo)
-        self._test_create_many(self.pq_name_repo)
+        for db_name, repo in self._get_repos():
+            with self.subTest(db=db_name):
+                self._test_create_many(repo)
 
     def test_required_datasource_attribute(self):
         """Throws NotImplementedError when used without _datasource defined on the class"""
@@ -127,8 +166,8 @@ class TestSQLAlchemyRepository(unittest.TestCase):
 
     @patch("lilly.repositories.SQLAlchemyRepository._dto_cls", new_callable=PropertyMock)
     @patch("lilly.repositories.SQLAlchemyRepository._datasource", new_callable=PropertyMock)
-    def test_required_to_output_dto(self, mock_repo_datasource: PropertyMock, mock_dto_cls):
-        """Throws NotImplementedError when used without _dto_cls defined on the class"""
+    def test_required_model_cls(self, mock_repo_datasource: PropertyMock, mock_dto_cls):
+        """Throws NotImplementedError when used without _model_cls defined on the class"""
         mock_repo_datasource.return_value = self.sqlite_name_repo.db_source
         mock_dto_cls.return_value = NameTestDTO
         mock_repo = SQLAlchemyRepository()
@@ -167,7 +206,7 @@ class TestSQLAlchemyRepository(unittest.TestCase):
         with repo.db_source.connect() as session:
             for expected in test_data:
                 got_after_update = repo.update_one(expected.id, expected)
-                got_after_get = session.query(NameTest).get(expected.id)
+                got_after_get = session.get(NameTest, expected.id)
 
                 self.assertEqual(expected, got_after_update)
                 self.assertEqual(expected, NameTestDTO.from_orm(got_after_get))
@@ -196,8 +235,7 @@ class TestSQLAlchemyRepository(unittest.TestCase):
         with repo.db_source.connect() as session:
             self._add_dummy_data(repo.db_source, MOCK_NAME_RECORDS)
             got_after_update = repo.update_many(new_data, NameTest.id < 10, "id > 2", title="Roe")
-            got_after_get = [NameTestDTO.from_orm(record) for record in
-                             session.query(NameTest).order_by(NameTest.id).all()]
+            got_after_get = _get_all_names(session)
 
         self.assertListEqual(expected_after_update, got_after_update)
         self.assertListEqual(expected_after_get, got_after_get)
@@ -214,7 +252,7 @@ class TestSQLAlchemyRepository(unittest.TestCase):
                 got = repo.remove_one(record_id=record_id)
                 self.assertEqual(expected, got)
 
-                got_from_get = session.query(NameTest).get(record_id)
+                got_from_get = session.get(NameTest, record_id)
                 self.assertIsNone(got_from_get)
 
     def _test_remove_many(self, repo: NamesTestRepository):
@@ -238,8 +276,7 @@ class TestSQLAlchemyRepository(unittest.TestCase):
             ]
 
             got_after_delete = repo.remove_many(NameTest.id < 10, "id > 2", title="Roe")
-            got_after_get = [NameTestDTO.from_orm(record) for record in
-                             session.query(NameTest).order_by(NameTest.id).all()]
+            got_after_get = _get_all_names(session)
 
             self.assertListEqual(expected_after_update, got_after_delete)
             self.assertListEqual(expected_after_get, got_after_get)
@@ -271,8 +308,7 @@ class TestSQLAlchemyRepository(unittest.TestCase):
 
         with repo.db_source.connect() as session:
             got_after_create = repo.create_many(records=records)
-            got_after_get = [NameTestDTO.from_orm(record) for record in
-                             session.query(NameTest).order_by(NameTest.id).all()]
+            got_after_get = _get_all_names(session)
 
             self.assertListEqual([], got_after_create)
             self.assertListEqual(expected, got_after_get)
@@ -3,207 +3,131 @@ Module for testing the CRUDRouteSet
 """
 import json
 import unittest
-from unittest.mock import patch, PropertyMock, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 
 from fastapi.testclient import TestClient
 
 from lilly import Lilly
 from test.assets.mock_internals import NameTestDTO, MockRepository, NameTestCreationDTO
+# importing this registers it with the router
 from test.assets.mock_services.crud.routes import MockCRUDRouteSet
 
+# sentinel marking where the coerced search clause appears in an expected repository call
+_SEARCH_CLAUSE = object()
+
+# the action classes whose _repository property gets patched with the shared repository mock
+_ACTION_CLASSES = (
+    "CreateOneAction",
+    "CreateManyAction",
+    "ReadOneAction",
+    "ReadManyAction",
+    "UpdateOneAction",
+    "UpdateManyAction",
+    "DeleteOneAction",
+    "DeleteManyAction",
+)
+
+# fixtures are constants, so they are built and serialized once at import
+_HEADERS = {"Content-Type": "application/json"}
+_ROUTE_SETTINGS = MockCRUDRouteSet.get_settings()
+_BASE_PATH = _ROUTE_SETTINGS.base_path
+_BASE_PATH_MANY = _ROUTE_SETTINGS.base_path_for_multiple_items
+_Q = "doe"
+_EXPECTED_ONE = NameTestDTO(id=1, title="Some Name")
+_EXPECTED_MANY = [_EXPECTED_ONE]
+_CREATION_REQUEST = NameTestCreationDTO(title="Some Name")
+_NEW_RECORD = NameTestDTO(id=1, title="Some Change")
+_PARTIAL_RECORD = NameTestCreationDTO(title="Some Change")
+
+
+def _render_response_body(value) -> bytes:
+    """Renders the expected response body exactly as fastapi's JSONResponse does"""
+    content = [record.dict() for record in value] if isinstance(value, list) else value.dict()
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+_EXPECTED_ONE_BODY = _render_response_body(_EXPECTED_ONE)
+_EXPECTED_MANY_BODY = _render_response_body(_EXPECTED_MANY)
+
+# query strings as pre-built param tuples; the client encodes them instead of
+# the tests concatenating and the router re-parsing hand-rolled url suffixes
+_READ_MANY_PARAMS = (("skip", 6), ("limit", 3), ("q", _Q))
+_SEARCH_PARAMS = (("q", _Q),)
+
+# (route, repository method, verb, url, query params, request body,
+#  repository response, expected response body, expected call args, expected call kwargs)
+_CASES = [
+    ("create_one", "create_one", "POST", f"{_BASE_PATH}/", None,
+     _CREATION_REQUEST.json(), _EXPECTED_ONE, _EXPECTED_ONE_BODY, (_CREATION_REQUEST,), {}),
+    ("create_many", "create_many", "POST", f"{_BASE_PATH_MANY}/", None,
+     json.dumps([_CREATION_REQUEST.dict()]), _EXPECTED_MANY, _EXPECTED_MANY_BODY, ([_CREATION_REQUEST],), {}),
+    ("read_one", "get_one", "GET", f"{_BASE_PATH}/6", None,
+     None, _EXPECTED_ONE, _EXPECTED_ONE_BODY, (6,), {}),
+    ("read_many", "get_many", "GET", f"{_BASE_PATH}/", _READ_MANY_PARAMS,
+     None, _EXPECTED_MANY, _EXPECTED_MANY_BODY, (_SEARCH_CLAUSE,), {"skip": 6, "limit": 3}),
+    ("update_one", "update_one", "PUT", f"{_BASE_PATH}/6", None,
+     _NEW_RECORD.json(), _EXPECTED_ONE, _EXPECTED_ONE_BODY, (6, _NEW_RECORD), {}),
+    ("update_many", "update_many", "PUT", f"{_BASE_PATH_MANY}/", _SEARCH_PARAMS,
+     _PARTIAL_RECORD.json(), _EXPECTED_MANY, _EXPECTED_MANY_BODY, (_PARTIAL_RECORD, _SEARCH_CLAUSE), {}),
+    ("delete_one", "remove_one", "DELETE", f"{_BASE_PATH}/6", None,
+     None, _EXPECTED_ONE, _EXPECTED_ONE_BODY, (6,), {}),
+    ("delete_many", "remove_many", "DELETE", f"{_BASE_PATH_MANY}/", _SEARCH_PARAMS,
+     None, _EXPECTED_MANY, _EXPECTED_MANY_BODY, (_SEARCH_CLAUSE,), {}),
+]
+
 
 class TestCRUDRouteSet(unittest.TestCase):
     """Tests for the CRUD RouteSet"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Builds the app, test client and shared repository mock once for the whole class"""
+        cls.repo_mock = MagicMock(spec=MockRepository)
+        cls._patchers = [
+            patch("lilly.applications.Lilly._register_routes"),
+            patch("lilly.applications.Lilly._register_settings"),
+        ]
+        cls._patchers.extend(
+            patch(f"lilly.actions.{action_cls}._repository",
+                  new_callable=PropertyMock, return_value=cls.repo_mock)
+            for action_cls in _ACTION_CLASSES)
+        for patcher in cls._patchers:
+            patcher.start()
+        cls.app = Lilly()
+        cls.client = TestClient(app=cls.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in cls._patchers:
+            patcher.stop()
+
     def setUp(self):
-        """Initialize some common variables"""
-        self.headers = {
-            "Content-Type": "application/json"
-        }
-        # importing this registers it with the router
-        self.mock_route_set_cls = MockCRUDRouteSet
-        self.route_settings = self.mock_route_set_cls.get_settings()
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.create_one")
-    @patch("lilly.actions.CreateOneAction._repository", new_callable=PropertyMock)
-    def test_create_one_action(self, mock_repo: PropertyMock, mock_create_one: MagicMock, *args):
-        """The call to create one should return the repository's create_one method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = NameTestDTO(id=1, title="Some Name")
-        request = NameTestCreationDTO(title="Some Name")
-
-        mock_create_one.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.post(
-            f"{self.route_settings.base_path}/", data=request.json(), headers=self.headers).json()
-
-        got = NameTestDTO(**response_json)
-
-        mock_create_one.assert_called_with(request)
-        self.assertEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.create_many")
-    @patch("lilly.actions.CreateManyAction._repository", new_callable=PropertyMock)
-    def test_create_many_action(self, mock_repo: PropertyMock, mock_create_many: MagicMock, *args):
-        """The call to create many should return the repository's create_many method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = [NameTestDTO(id=1, title="Some Name")]
-        request = [NameTestCreationDTO(title="Some Name")]
-        request_json = json.dumps([record.dict() for record in request])
-
-        mock_create_many.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.post(
-            f"{self.route_settings.base_path_for_multiple_items}/",
-            data=request_json, headers=self.headers).json()
-
-        got = [NameTestDTO(**record) for record in response_json]
-
-        mock_create_many.assert_called_with(request)
-        self.assertListEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.get_one")
-    @patch("lilly.actions.ReadOneAction._repository", new_callable=PropertyMock)
-    def test_read_one_action(self, mock_repo: PropertyMock, mock_get_one: MagicMock, *args):
-        """A call to read one  should return the repository's get_one method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = NameTestDTO(id=1, title="Some Name")
-        record_id = 6
-
-        mock_get_one.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.get(f"{self.route_settings.base_path}/{record_id}", headers=self.headers).json()
-
-        got = NameTestDTO(**response_json)
-
-        mock_get_one.assert_called_with(record_id)
-        self.assertEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.get_many")
-    @patch("lilly.actions.ReadManyAction._repository", new_callable=PropertyMock)
-    def test_read_many_action(self, mock_repo: PropertyMock, mock_get_many: MagicMock, *args):
-        """A call to the read many action should return the repository's get_many method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = [NameTestDTO(id=1, title="Some Name")]
-        q = "doe"
-        skip = 6
-        limit = 3
-
-        mock_get_many.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.get(f"{self.route_settings.base_path}/?skip={skip}&limit={limit}&q={q}",
-                                   headers=self.headers).json()
-
-        got = [NameTestDTO(**record) for record in response_json]
-
-        mock_get_many.assert_called_with(f"title LIKE '%{q}%'", skip=skip, limit=limit)
-        self.assertListEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.update_one")
-    @patch("lilly.actions.UpdateOneAction._repository", new_callable=PropertyMock)
-    def test_update_one_action(self, mock_repo: PropertyMock, mock_update_one: MagicMock, *args):
-        """Call to update one should return the repository's update_one method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = NameTestDTO(id=1, title="Some Name")
-        record_id = 6
-        new_record = NameTestDTO(id=1, title="Some Change")
-
-        mock_update_one.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.put(
-            f"{self.route_settings.base_path}/{record_id}", data=new_record.json(), headers=self.headers).json()
-
-        got = NameTestDTO(**response_json)
-
-        mock_update_one.assert_called_with(record_id, new_record)
-        self.assertEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.update_many")
-    @patch("lilly.actions.UpdateManyAction._repository", new_callable=PropertyMock)
-    def test_update_many_action(self, mock_repo: PropertyMock, mock_update_many: MagicMock, *args):
-        """A call to the update many action should return the repository's update_many method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = [NameTestDTO(id=1, title="Some Name")]
-        new_record = NameTestCreationDTO(title="Some Change")
-        q = "doe"
-
-        mock_update_many.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.put(f"{self.route_settings.base_path_for_multiple_items}/?q={q}",
-                                   data=new_record.json(),
-                                   headers=self.headers).json()
-
-        got = [NameTestDTO(**record) for record in response_json]
-
-        mock_update_many.assert_called_with(new_record, f"title LIKE '%{q}%'")
-        self.assertListEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.remove_one")
-    @patch("lilly.actions.DeleteOneAction._repository", new_callable=PropertyMock)
-    def test_delete_one_action(self, mock_repo: PropertyMock, mock_remove_one: MagicMock, *args):
-        """A call to delete one should return the repository's remove_one method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = NameTestDTO(id=1, title="Some Name")
-        record_id = 6
-
-        mock_remove_one.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.delete(f"{self.route_settings.base_path}/{record_id}", headers=self.headers).json()
-
-        got = NameTestDTO(**response_json)
-
-        mock_remove_one.assert_called_with(record_id)
-        self.assertEqual(expected_response, got)
-
-    @patch("lilly.applications.Lilly._register_routes")
-    @patch("lilly.applications.Lilly._register_settings")
-    @patch("test.assets.mock_internals.MockRepository.remove_many")
-    @patch("lilly.actions.DeleteManyAction._repository", new_callable=PropertyMock)
-    def test_delete_many_action(self, mock_repo: PropertyMock, mock_remove_many: MagicMock, *args):
-        """A call to delete many should return the repository's remove_many method's response"""
-        app = Lilly()
-        client = TestClient(app=app)
-        expected_response = [NameTestDTO(id=1, title="Some Name")]
-        q = "doe"
-
-        mock_remove_many.return_value = expected_response
-        mock_repo.return_value = MockRepository()
-
-        response_json = client.delete(
-            f"{self.route_settings.base_path_for_multiple_items}/?q={q}", headers=self.headers).json()
-
-        got = [NameTestDTO(**record) for record in response_json]
-
-        mock_remove_many.assert_called_with(f"title LIKE '%{q}%'")
-        self.assertListEqual(expected_response, got)
+        """Clears calls and return values the previous test left on the shared repository mock"""
+        self.repo_mock.reset_mock(return_value=True)
+
+    def test_crud_actions(self):
+        """Each CRUD route returns its repository method's response; one subTest per route"""
+        for route, repo_method, verb, url, params, body, repo_response, expected_body, expected_args, \
+                expected_kwargs in _CASES:
+            with self.subTest(route=route):
+                mock_method = getattr(self.repo_mock, repo_method)
+                mock_method.return_value = repo_response
+
+                response = self.client.request(verb, url, params=params, data=body, headers=_HEADERS)
+
+                # raw byte comparison against the pre-rendered body skips a json parse
+                # and a pydantic re-validation per route
+                self.assertEqual(response.content, expected_body)
+
+                got_args, got_kwargs = mock_method.call_args
+                self.assertEqual(len(got_args), len(expected_args))
+                for got_arg, expected_arg in zip(got_args, expected_args):
+                    if expected_arg is _SEARCH_CLAUSE:
+                        self.assertEqual(str(got_arg), "title LIKE :q")
+                        self.assertEqual(got_arg.compile().params, {"q": f"%{_Q}%"})
+                    else:
+                        self.assertEqual(got_arg, expected_arg)
+                self.assertEqual(got_kwargs, expected_kwargs)
 
 
 if __name__ == '__main__':